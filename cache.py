@@ -0,0 +1,142 @@
+"""
+Channel metadata cache
+----------------------
+
+A small SQLite-backed cache of ``channels.list`` items keyed on channel ID.
+The discovery pipeline consults it before enriching channel IDs so that
+channels fetched recently (for example by an earlier run on the same day)
+do not cost another API call or HTTP round trip.
+
+Snippet data (title, creation date) rarely changes and is considered fresh
+for 24 hours; statistics move faster and are considered fresh for one hour.
+An entry is only served from the cache while both parts are fresh.
+"""
+
+import json
+import sqlite3
+import time
+from typing import Dict, Iterable, List
+
+# Default location of the cache database, relative to the working directory.
+CACHE_PATH = "channel_cache.sqlite3"
+# How long each part of a cached channel stays fresh, in seconds.
+SNIPPET_TTL_SECONDS = 24 * 3600
+STATS_TTL_SECONDS = 3600
+# Stay below SQLite's limit on the number of bound parameters per statement.
+_MAX_PARAMS = 900
+
+
+class ChannelCache:
+    """SQLite cache of ``channels.list`` items.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the SQLite database file.  Created if it does not exist.
+        Defaults to ``CACHE_PATH``.
+    """
+
+    def __init__(self, path: str = CACHE_PATH) -> None:
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS channels ("
+            "id TEXT PRIMARY KEY, "
+            "snippet_json TEXT, "
+            "stats_json TEXT, "
+            "stats_fetched_at REAL, "
+            "snippet_fetched_at REAL)"
+        )
+        self.conn.commit()
+
+    def __enter__(self) -> "ChannelCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self.conn.close()
+
+    def get_fresh(self, channel_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Return cached items for the given channel IDs that are still fresh.
+
+        Parameters
+        ----------
+        channel_ids : Iterable[str]
+            The channel IDs to look up.
+
+        Returns
+        -------
+        Dict[str, Dict]
+            A mapping of channel ID to an item shaped like a ``channels.list``
+            response item (``id``, ``snippet`` and ``statistics`` keys), plus
+            ``statisticsFetchedAt``, the epoch time the statistics were
+            fetched.  Missing or stale IDs are omitted.
+        """
+        ids = list(channel_ids)
+        now = time.time()
+        hits: Dict[str, Dict] = {}
+        for i in range(0, len(ids), _MAX_PARAMS):
+            chunk = ids[i:i + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                "SELECT id, snippet_json, stats_json, stats_fetched_at FROM channels "
+                f"WHERE id IN ({placeholders}) "
+                "AND stats_fetched_at > ? AND snippet_fetched_at > ?",
+                (*chunk, now - STATS_TTL_SECONDS, now - SNIPPET_TTL_SECONDS),
+            )
+            for channel_id, snippet_json, stats_json, stats_fetched_at in rows:
+                hits[channel_id] = {
+                    "id": channel_id,
+                    "snippet": json.loads(snippet_json),
+                    "statistics": json.loads(stats_json),
+                    "statisticsFetchedAt": stats_fetched_at,
+                }
+        return hits
+
+    def upsert(self, items: List[Dict], snippet_fetched: bool = True) -> None:
+        """Store ``channels.list`` response items, replacing older entries.
+
+        Parameters
+        ----------
+        items : List[Dict]
+            Items as returned in the ``items`` field of a ``channels.list``
+            response.
+        snippet_fetched : bool, optional
+            Whether the items' snippets were fetched from the API just now.
+            Pass ``False`` when only the statistics are fresh (for example
+            when the snippet was filled in from stored history): existing
+            entries then keep their snippet and its fetch time, and new
+            entries are stored with a snippet that is already stale.
+        """
+        now = time.time()
+        if snippet_fetched:
+            sql = (
+                "INSERT OR REPLACE INTO channels "
+                "(id, snippet_json, stats_json, stats_fetched_at, snippet_fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)"
+            )
+        else:
+            sql = (
+                "INSERT INTO channels "
+                "(id, snippet_json, stats_json, stats_fetched_at, snippet_fetched_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET "
+                "stats_json = excluded.stats_json, stats_fetched_at = excluded.stats_fetched_at"
+            )
+        self.conn.executemany(
+            sql,
+            [
+                (
+                    item["id"],
+                    json.dumps(item.get("snippet", {})),
+                    json.dumps(item.get("statistics", {})),
+                    now,
+                    now if snippet_fetched else 0.0,
+                )
+                for item in items
+                if item.get("id")
+            ],
+        )
+        self.conn.commit()
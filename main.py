@@ -5,28 +5,42 @@ YouTube Channel Discovery Script
 This script uses Google's YouTube Data API v3 to discover brand‑new YouTube
 channels based on a set of simple "first video" search queries.  It then
 retrieves basic channel statistics for those channels and writes any channel
-created in the last 30 days to a CSV file.  The CSV filename embeds the
-current date so that you can collect a daily snapshot over time.
+created in the last 30 days to a Parquet dataset.  Each run adds a partition
+for the current date so that you can collect a daily snapshot over time.
 
 How it works
 ^^^^^^^^^^^^
 
 1. **Discovery** – For each query in ``SEARCH_QUERIES``, the script issues a
-   ``search.list`` request ordered by date.  It sets ``publishedAfter`` to 24
-   hours ago so that only very recent videos are considered.  Each
-   search result returns a ``channelId`` which the script collects.
-2. **Enrichment** – The collected channel IDs are grouped into batches of
-   50 (the maximum allowed per ``channels.list`` call) and passed to the
-   ``channels.list`` method with ``part=snippet,statistics``.  The script
-   extracts the channel title, creation date, subscriber count, video count
-   and view count from the response.
-3. **Filtering** – Results are loaded into a Pandas ``DataFrame``.  The
-   channel age in days is calculated by subtracting the channel's
-   ``publishedAt`` date from the time the data was retrieved.  Only channels
-   less than or equal to 30 days old are retained.
-4. **Saving** – The filtered data is written to a CSV file named
-   ``new_youtube_channels_<YYYY-MM-DD>.csv`` in the current directory.  The
-   date refers to when the script was executed (UTC).
+   ``search.list`` request ordered by date.  The last 24 hours are split into
+   a few equal time bins (``publishedAfter``/``publishedBefore``) so that each
+   query can return up to 50 results per bin rather than 50 in total.  All
+   query/bin pairs are sent concurrently with ``aiohttp`` against the REST
+   endpoint, so discovery takes roughly one round trip rather than one per
+   request.  Each search result returns a ``channelId`` which the script
+   collects.
+2. **Enrichment** – As soon as 50 new channel IDs (the maximum allowed per
+   ``channels.list`` call) have been discovered, they are passed to the
+   ``channels.list`` method with ``part=snippet,statistics`` on a small
+   thread pool while the remaining searches are still running; any leftover
+   IDs are sent once discovery finishes.  Channels fetched within the last
+   hour are served from a local SQLite cache (see ``cache.py``) instead of
+   being requested again.  Channels already present in the last 30 days of
+   the Parquet dataset only have their statistics refreshed; their title and
+   creation date are taken from the stored history.  The script extracts the
+   channel title, creation date, subscriber count, video count and view
+   count from the response.
+3. **Filtering** – A single cutoff timestamp (now minus 30 days) is computed
+   once and compared with each channel's ``publishedAt`` date in plain
+   Python; the daily result set is small enough that Pandas is not needed.
+   Only channels less than or equal to 30 days old are retained.
+4. **Saving** – The filtered data is written with ``pyarrow`` as a
+   ZSTD-compressed Parquet file at
+   ``data/year=<YYYY>/month=<MM>/day=<DD>/part.parquet``.  The date refers to
+   when the script was executed (UTC).  Because the directories follow the
+   Hive partitioning layout, the whole history can be loaded as one table,
+   e.g. ``pyarrow.parquet.read_table("data")``, with column pruning and
+   predicate pushdown.
 
 The script reads your YouTube API key from the environment variable
 ``YOUTUBE_API_KEY``.  For local development you can place this key in a
@@ -53,20 +67,142 @@ individual user information or perform any actions on behalf of users.  It
 therefore complies with those principles.
 """
 
+import asyncio
 import os
-import time
-from datetime import datetime, timedelta
-from typing import List, Dict
-
-import pandas as pd
+import random
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import aiohttp
+import orjson
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 from dotenv import load_dotenv
 
+from cache import ChannelCache
+
+
+# REST endpoint used by the concurrent discovery phase.
+SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
+# Maximum number of search requests allowed in flight at once.
+MAX_CONCURRENT_SEARCHES = 5
+# Maximum number of ``channels.list`` calls in flight at once.  Each worker
+# thread owns its own API client.
+MAX_ENRICH_WORKERS = 4
+# Quota cost of a single ``search.list`` call and the default daily budget.
+SEARCH_QUOTA_COST = 100
+DAILY_QUOTA_UNITS = 10_000
+# Transient HTTP statuses that the aiohttp path retries with exponential
+# backoff, and the maximum number of attempts per request on either path.
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 5
+# Partial-response masks so the API only returns the fields that are read.
+SEARCH_FIELDS = "items(snippet/channelId)"
+CHANNEL_FIELDS = "items(id,snippet(title,publishedAt),statistics(subscriberCount,videoCount,viewCount))"
+STATS_FIELDS = "items(id,statistics(subscriberCount,videoCount,viewCount))"
+# Root directory of the partitioned Parquet dataset.
+DATA_DIR = "data"
+# Fields collected for every channel.  Channel data is held column-wise as a
+# mapping of each field name to a list of values.
+CHANNEL_COLUMNS = (
+    "channel_id",
+    "channel_title",
+    "published_at",
+    "subscriber_count",
+    "video_count",
+    "view_count",
+    "data_retrieved_at",
+)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return the delay before retry number ``attempt`` (exponential with jitter)."""
+    return 2 ** attempt + random.random()
+
+
+def _api_error_message(body: bytes) -> str:
+    """Return ``"<reason>: <message>"`` from a Google API error response body."""
+    try:
+        error = orjson.loads(body).get("error", {})
+    except (orjson.JSONDecodeError, AttributeError):
+        return body.decode("utf-8", "replace")[:200]
+    reason = (error.get("errors") or [{}])[0].get("reason", "")
+    message = error.get("message", "")
+    return f"{reason}: {message}" if reason else message
+
+
+async def _get_json_with_retry(
+    session: aiohttp.ClientSession, url: str, params: Dict, headers: Dict, semaphore: asyncio.Semaphore
+) -> Dict:
+    """GET a REST endpoint and decode the JSON body, retrying transient failures.
+
+    Responses with a status in ``RETRYABLE_STATUSES``, connection errors and
+    timeouts are retried up to ``MAX_ATTEMPTS`` times with exponential
+    backoff and random jitter, so concurrent failures do not all retry in
+    lockstep.  Any other error, or the last failed attempt, is re-raised.
+    For non-2xx responses the raised ``ClientResponseError`` carries the
+    API's error reason and message rather than the HTTP status text.  The
+    semaphore is only held while a request is in flight, not while waiting
+    to retry.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            async with semaphore:
+                async with session.get(url, params=params, headers=headers) as response:
+                    if not response.ok:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=response.status,
+                            message=_api_error_message(await response.read()),
+                            headers=response.headers,
+                        )
+                    return await response.json(loads=orjson.loads)
+        except aiohttp.ClientResponseError as e:
+            if e.status not in RETRYABLE_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                raise
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+        await asyncio.sleep(_backoff_delay(attempt))
+
+
+class OrjsonModel(JsonModel):
+    """``JsonModel`` that decodes response bodies with ``orjson``.
+
+    ``orjson`` parses the nested ``search.list``/``channels.list`` payloads
+    several times faster than the standard library ``json`` module.
+    """
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
 
 def get_youtube_client(api_key: str):
     """Initialise the YouTube Data API client.
 
+    The client is bound to a single ``httplib2.Http`` instance, created with
+    googleapiclient's defaults (including its 60 second socket timeout), so
+    every ``channels.list`` call made through it reuses the same keep-alive
+    connection instead of paying for a new TLS handshake.  The discovery
+    document is loaded from the copy bundled with ``google-api-python-client``
+    rather than fetched over the network on every run, and responses are
+    decoded with :class:`OrjsonModel`.
+
     Parameters
     ----------
     api_key : str
@@ -77,193 +213,459 @@ def get_youtube_client(api_key: str):
     googleapiclient.discovery.Resource
         A resource object with methods to call the API.
     """
-    return build("youtube", "v3", developerKey=api_key)
+    http = build_http()
+    return build(
+        "youtube",
+        "v3",
+        developerKey=api_key,
+        http=http,
+        cache_discovery=False,
+        static_discovery=True,
+        model=OrjsonModel(),
+    )
+
 
+_thread_state = threading.local()
 
-def search_new_videos(youtube, query: str, published_after: str) -> List[str]:
-    """Search YouTube for videos published after a given date and return channel IDs.
 
-    A helper around ``youtube.search().list`` that catches errors and
-    consolidates pagination if necessary.  Currently we limit results to the
-    first 50 per query to control quota usage.
+def _thread_client(api_key: str):
+    """Return the calling thread's YouTube client, creating it on first use.
+
+    ``httplib2.Http`` is not thread-safe, so every worker thread gets its own
+    client (and therefore its own pooled connection).
+    """
+    youtube = getattr(_thread_state, "youtube", None)
+    if youtube is None:
+        youtube = _thread_state.youtube = get_youtube_client(api_key)
+    return youtube
+
+
+def _to_rfc3339(dt: datetime) -> str:
+    """Format an aware UTC datetime as an RFC 3339 string with whole seconds."""
+    return dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def time_bins(window_hours: int, n_bins: int) -> Iterator[Tuple[str, str]]:
+    """Split the last ``window_hours`` hours into ``n_bins`` equal time ranges.
 
     Parameters
     ----------
-    youtube : googleapiclient.discovery.Resource
-        The YouTube API client.
+    window_hours : int
+        The length of the window ending now, in hours.
+    n_bins : int
+        The number of consecutive sub-windows to produce.
+
+    Yields
+    ------
+    Tuple[str, str]
+        ``(published_after, published_before)`` ISO 8601 strings for each bin,
+        oldest first.
+    """
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(hours=window_hours)
+    step = (end - start) / n_bins
+    for i in range(n_bins):
+        bin_start = start + step * i
+        bin_end = end if i == n_bins - 1 else bin_start + step
+        yield _to_rfc3339(bin_start), _to_rfc3339(bin_end)
+
+
+async def _search_async(
+    session: aiohttp.ClientSession,
+    query: str,
+    published_after: str,
+    published_before: str,
+    api_key: str,
+    semaphore: asyncio.Semaphore,
+) -> Set[str]:
+    """Search YouTube for videos published in a time range and return channel IDs.
+
+    Calls the ``search.list`` REST endpoint directly so that several queries
+    can be in flight at the same time.  Errors are logged and an empty set
+    is returned.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The shared HTTP session.
     query : str
         The search term to use (e.g., "first vlog").
     published_after : str
         ISO 8601 date/time string specifying the earliest publication time of
         videos to include.
+    published_before : str
+        ISO 8601 date/time string specifying the latest publication time of
+        videos to include.
+    api_key : str
+        Your YouTube Data API v3 key.
+    semaphore : asyncio.Semaphore
+        Limits how many searches are in flight at once.
 
     Returns
     -------
-    List[str]
-        A list of channel IDs associated with the search results.
+    Set[str]
+        The unique channel IDs associated with the search results.
     """
-    channel_ids: List[str] = []
+    channel_ids: Set[str] = set()
+    params = {
+        "q": query,
+        "type": "video",
+        "order": "date",
+        "publishedAfter": published_after,
+        "publishedBefore": published_before,
+        "part": "snippet",
+        "maxResults": 50,
+        "fields": SEARCH_FIELDS,
+    }
+    # Send the key in a header so it never shows up in logged request URLs.
+    headers = {"X-Goog-Api-Key": api_key}
     try:
-        search_request = (
-            youtube.search()
-            .list(
-                q=query,
-                type="video",
-                order="date",
-                publishedAfter=published_after,
-                part="snippet",
-                maxResults=50,
-            )
-        )
-        search_response = search_request.execute()
+        search_response = await _get_json_with_retry(session, SEARCH_URL, params, headers, semaphore)
         for item in search_response.get("items", []):
             channel_id = item.get("snippet", {}).get("channelId")
             if channel_id:
-                channel_ids.append(channel_id)
-    except HttpError as e:
-        # Log the error; in a production system you might integrate with a
-        # monitoring/alerting service instead of printing.
+                channel_ids.add(channel_id)
+    except aiohttp.ClientResponseError as e:
+        print(f"HTTP {e.status} error during search for query '{query}': {e.message}")
+    except aiohttp.ClientError as e:
         print(f"HTTP error during search for query '{query}': {e}")
     except Exception as e:
         print(f"Unexpected error during search for query '{query}': {e}")
     return channel_ids
 
 
-def get_channel_details(youtube, channel_ids: List[str]) -> List[Dict[str, str]]:
-    """Fetch details for a list of channel IDs.
+def _empty_columns() -> Dict[str, List]:
+    """Return an empty column-oriented container for channel data."""
+    return {col: [] for col in CHANNEL_COLUMNS}
 
-    Uses the ``channels.list`` endpoint to retrieve the channel title, creation
-    date and statistics (subscriber count, view count, video count) for up to
-    50 channels at once.  Handles any errors gracefully by returning an empty
-    list if the request fails.
 
-    Parameters
-    ----------
-    youtube : googleapiclient.discovery.Resource
-        The YouTube API client.
-    channel_ids : List[str]
-        A list of up to 50 channel IDs.
+def _parse_channel_response(response: Dict, data: Dict[str, List]) -> None:
+    """Append the items of a ``channels.list`` response to the ``data`` columns.
 
-    Returns
-    -------
-    List[Dict[str, str]]
-        A list of dictionaries containing channel metadata.
+    Items served from :class:`ChannelCache` carry a ``statisticsFetchedAt``
+    epoch timestamp, which is used as their retrieval time instead of now.
+    """
+    # All fetched items of one response were retrieved at the same moment, so
+    # format the timestamp once rather than per channel
+    retrieved_at = _to_rfc3339(datetime.now(timezone.utc))
+    for item in response.get("items", []):
+        fetched_at = item.get("statisticsFetchedAt")
+        snippet = item.get("snippet", {})
+        stats = item.get("statistics", {})
+        data["channel_id"].append(item.get("id"))
+        data["channel_title"].append(snippet.get("title", ""))
+        data["published_at"].append(snippet.get("publishedAt", ""))
+        # The API returns counts as strings; convert them once here so the
+        # columns are integer-typed from the start
+        data["subscriber_count"].append(int(stats.get("subscriberCount") or 0))
+        data["video_count"].append(int(stats.get("videoCount") or 0))
+        data["view_count"].append(int(stats.get("viewCount") or 0))
+        data["data_retrieved_at"].append(
+            retrieved_at if fetched_at is None else _to_rfc3339(datetime.fromtimestamp(fetched_at, timezone.utc))
+        )
+
+
+def _get_channel_items(
+    youtube, channel_ids: List[str], part: str = "snippet,statistics", fields: str = CHANNEL_FIELDS
+) -> List[Dict]:
+    """Call ``channels.list`` for up to 50 IDs and return the raw response items.
+
+    Rate-limit and server errors as well as socket errors are retried by
+    googleapiclient itself with exponential backoff and jitter.  Errors that
+    persist are logged and an empty list is returned.
     """
-    data: List[Dict[str, str]] = []
     if not channel_ids:
-        return data
+        return []
     try:
         response = (
             youtube.channels()
             .list(
                 id=','.join(channel_ids),
-                part="snippet,statistics",
+                part=part,
+                fields=fields,
             )
-            .execute()
+            .execute(num_retries=MAX_ATTEMPTS - 1)
         )
-        for item in response.get("items", []):
-            snippet = item.get("snippet", {})
-            stats = item.get("statistics", {})
-            data.append(
-                {
-                    "channel_id": item.get("id"),
-                    "channel_title": snippet.get("title", ""),
-                    "published_at": snippet.get("publishedAt", ""),
-                    "subscriber_count": stats.get("subscriberCount", 0),
-                    "video_count": stats.get("videoCount", 0),
-                    "view_count": stats.get("viewCount", 0),
-                    "data_retrieved_at": datetime.utcnow().isoformat() + "Z",
-                }
-            )
+        return response.get("items", [])
     except HttpError as e:
         print(f"HTTP error retrieving channel details: {e}")
     except Exception as e:
         print(f"Unexpected error retrieving channel details: {e}")
-    return data
+    return []
 
 
-def collect_new_channels(youtube, queries: List[str], window_hours: int = 24) -> List[Dict[str, str]]:
+def collect_new_channels(
+    api_key: str,
+    queries: List[str],
+    window_hours: int = 24,
+    n_bins: int = 4,
+    cache: Optional[ChannelCache] = None,
+    known_channels: Optional[Dict[str, Dict]] = None,
+) -> Dict[str, List]:
     """Collect channel details for recent videos across multiple search queries.
 
     Parameters
     ----------
-    youtube : googleapiclient.discovery.Resource
-        The YouTube API client.
+    api_key : str
+        Your YouTube Data API v3 key.
     queries : List[str]
         A list of search terms to probe for "first video" type uploads.
     window_hours : int, optional
         The time window in hours for which to consider videos.  Defaults to 24.
+    n_bins : int, optional
+        The number of sub-windows the time window is split into.  Each query
+        is searched once per bin, so the search cost is
+        ``n_bins * len(queries) * 100`` quota units.  Defaults to 4.
+    cache : ChannelCache, optional
+        Cache consulted before enriching channel IDs.  Defaults to no cache.
+    known_channels : Dict[str, Dict], optional
+        Snippets of channels seen in earlier runs, as returned by
+        :func:`load_known_channels`.  Only statistics are requested for these
+        channels.  Defaults to none.
 
     Returns
     -------
-    List[Dict[str, str]]
-        A list of dictionaries containing channel details.
+    Dict[str, List]
+        Channel details as a mapping of column name to values.
+
+    Raises
+    ------
+    ValueError
+        If the planned searches would exceed the daily quota.
+    """
+    search_cost = n_bins * len(queries) * SEARCH_QUOTA_COST
+    if search_cost > DAILY_QUOTA_UNITS:
+        raise ValueError(
+            f"{len(queries)} queries over {n_bins} time bins would cost {search_cost} "
+            f"quota units, exceeding the daily budget of {DAILY_QUOTA_UNITS}."
+        )
+    # Compute the time bins once, up front, so every search shares the same
+    # boundaries regardless of when its request is actually sent
+    bins = list(time_bins(window_hours, n_bins))
+    return asyncio.run(_discover_and_enrich(api_key, queries, bins, cache, known_channels or {}))
+
+
+def _get_channel_items_in_thread(api_key: str, channel_ids: List[str], part: str, fields: str) -> List[Dict]:
+    """Run :func:`_get_channel_items` with the calling thread's own client."""
+    return _get_channel_items(_thread_client(api_key), channel_ids, part, fields)
+
+
+async def _discover_and_enrich(
+    api_key: str,
+    queries: List[str],
+    bins: List[Tuple[str, str]],
+    cache: Optional[ChannelCache],
+    known_channels: Dict[str, Dict],
+) -> Dict[str, List]:
+    """Run discovery and enrichment as overlapping pipeline stages.
+
+    Every query/bin search runs concurrently as a producer that puts its set
+    of channel IDs on a queue.  A single consumer de-duplicates the IDs,
+    serves fresh ones from the cache and sends ``channels.list`` as soon as
+    50 uncached IDs have accumulated, so enrichment starts while searches are
+    still in flight.  Remaining IDs are flushed once all searches finish.
+    The blocking ``channels.list`` calls run on a thread pool of up to
+    ``MAX_ENRICH_WORKERS`` threads, each with its own client, so several
+    batches can be in flight at once.  Channels in ``known_channels`` are
+    batched separately and only their statistics are requested; their
+    snippet is filled in from the stored history.
+    """
+    data = _empty_columns()
+    queue: asyncio.Queue = asyncio.Queue()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+
+    async def _produce(session, query, published_after, published_before):
+        await queue.put(
+            await _search_async(session, query, published_after, published_before, api_key, semaphore)
+        )
+
+    async def _enrich(executor, channel_ids, stats_only):
+        loop = asyncio.get_running_loop()
+        if stats_only:
+            items = await loop.run_in_executor(
+                executor, _get_channel_items_in_thread, api_key, channel_ids, "statistics", STATS_FIELDS
+            )
+            for item in items:
+                item["snippet"] = known_channels[item["id"]]
+        else:
+            items = await loop.run_in_executor(
+                executor, _get_channel_items_in_thread, api_key, channel_ids, "snippet,statistics", CHANNEL_FIELDS
+            )
+        # Cache writes and column appends stay on the event loop thread
+        if cache is not None:
+            cache.upsert(items, snippet_fetched=not stats_only)
+        _parse_channel_response({"items": items}, data)
+
+    async def _consume(executor):
+        seen: Set[str] = set()
+        pending: List[str] = []
+        pending_known: List[str] = []
+        enrichments = []
+
+        def _dispatch(channel_ids, stats_only, flush=False):
+            while len(channel_ids) >= 50 or (flush and channel_ids):
+                enrichments.append(asyncio.create_task(_enrich(executor, channel_ids[:50], stats_only)))
+                del channel_ids[:50]
+
+        while True:
+            channel_ids = await queue.get()
+            if channel_ids is None:
+                break
+            new_ids = channel_ids - seen
+            seen |= new_ids
+            if cache is not None:
+                cached = cache.get_fresh(new_ids)
+                _parse_channel_response({"items": list(cached.values())}, data)
+                new_ids -= cached.keys()
+            for channel_id in new_ids:
+                (pending_known if channel_id in known_channels else pending).append(channel_id)
+            _dispatch(pending, stats_only=False)
+            _dispatch(pending_known, stats_only=True)
+        _dispatch(pending, stats_only=False, flush=True)
+        _dispatch(pending_known, stats_only=True, flush=True)
+        await asyncio.gather(*enrichments)
+
+    connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+    with ThreadPoolExecutor(max_workers=MAX_ENRICH_WORKERS) as executor:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            consumer = asyncio.create_task(_consume(executor))
+            await asyncio.gather(
+                *(
+                    _produce(session, query, after, before)
+                    for query in queries
+                    for after, before in bins
+                )
+            )
+            # Signal the consumer that discovery is complete
+            await queue.put(None)
+            await consumer
+    return data
+
+
+def _parse_published_at(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 ``publishedAt`` value, returning ``None`` if it is invalid.
+
+    Values without a UTC offset are taken to be UTC so the result can always
+    be compared with an aware cutoff.
     """
-    published_after = (datetime.utcnow() - timedelta(hours=window_hours)).isoformat("T") + "Z"
-    all_channel_ids = set()
-    # Discover channel IDs
-    for query in queries:
-        channel_ids = search_new_videos(youtube, query, published_after)
-        all_channel_ids.update(channel_ids)
-        # Sleep briefly to avoid sending too many requests in quick succession
-        time.sleep(0.1)
-    # Enrich channel IDs into detailed records
-    all_channel_data: List[Dict[str, str]] = []
-    channel_id_list = list(all_channel_ids)
-    for i in range(0, len(channel_id_list), 50):
-        batch = channel_id_list[i:i + 50]
-        details = get_channel_details(youtube, batch)
-        all_channel_data.extend(details)
-        time.sleep(0.1)
-    return all_channel_data
-
-
-def filter_and_save_channels(all_channel_data: List[Dict[str, str]], max_age_days: float = 30.0) -> str:
-    """Filter channel records for those created within ``max_age_days`` and save to CSV.
+    # ``fromisoformat`` is implemented in C and is several times faster than
+    # both ``strptime`` and slicing the string into ``int`` fields.  Before
+    # Python 3.11 it rejects a trailing "Z", so spell the offset out.
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def filter_and_save_channels(all_channel_data: Dict[str, List], max_age_days: float = 30.0) -> str:
+    """Filter channel records for those created within ``max_age_days`` and save to Parquet.
+
+    The rows are written to today's partition of the dataset under
+    ``DATA_DIR``.  Re-running on the same day replaces that day's partition.
+    The file is written to a temporary location first and moved into place,
+    so a failed write never leaves an empty or partial partition behind.
 
     Parameters
     ----------
-    all_channel_data : List[Dict[str, str]]
-        List of channel metadata dictionaries as returned by ``get_channel_details``.
+    all_channel_data : Dict[str, List]
+        Column-oriented channel metadata as returned by ``collect_new_channels``.
     max_age_days : float, optional
         Maximum age of channels (in days) to retain.  Defaults to 30.
 
     Returns
     -------
     str
-        The filename of the generated CSV file.  Returns an empty string if no
+        The path of the generated Parquet file.  Returns an empty string if no
         qualifying channels were found.
     """
-    if not all_channel_data:
+    if not all_channel_data["channel_id"]:
         print("No channel data collected; nothing to save.")
         return ""
-    df = pd.DataFrame(all_channel_data)
-    # Ensure datetime columns are parsed correctly
-    df["published_at_dt"] = pd.to_datetime(df["published_at"], errors="coerce")
-    df["data_retrieved_at_dt"] = pd.to_datetime(df["data_retrieved_at"], errors="coerce")
-    # Compute age in days
-    df["channel_age_days"] = (df["data_retrieved_at_dt"] - df["published_at_dt"]).dt.total_seconds() / (24 * 3600)
-    # Filter channels younger than max_age_days
-    df_new = df[df["channel_age_days"] <= max_age_days].copy()
-    # Convert numeric fields to integers (coerce non‑numeric to NaN then fill with 0)
-    for col in ["subscriber_count", "video_count", "view_count"]:
-        df_new[col] = pd.to_numeric(df_new[col], errors="coerce").fillna(0).astype("int64")
-    if df_new.empty:
+    published = [_parse_published_at(value) for value in all_channel_data["published_at"]]
+    # Filter channels younger than max_age_days against a single precomputed cutoff
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    keep = [i for i, published_at in enumerate(published) if published_at is not None and published_at >= cutoff]
+    if not keep:
         print(f"No channels younger than {max_age_days} days found.")
         return ""
-    date_str = datetime.utcnow().strftime("%Y-%m-%d")
-    filename = f"new_youtube_channels_{date_str}.csv"
-    df_new.to_csv(filename, index=False)
-    print(f"Saved {len(df_new)} new channels to {filename}.")
+    new_channels = {col: [values[i] for i in keep] for col, values in all_channel_data.items()}
+    new_channels["published_at_dt"] = [published[i] for i in keep]
+    today = datetime.now(timezone.utc)
+    partition = os.path.join(DATA_DIR, f"year={today:%Y}", f"month={today:%m}", f"day={today:%d}")
+    filename = os.path.join(partition, "part.parquet")
+    # Stage the file in the dataset root under a leading "." (dataset discovery
+    # skips such names, so a leftover file is never read as data) and only
+    # create the partition once the write succeeded
+    os.makedirs(DATA_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".parquet.tmp", dir=DATA_DIR)
+    os.close(fd)
+    try:
+        pq.write_table(pa.Table.from_pydict(new_channels), tmp_path, compression="zstd")
+        os.makedirs(partition, exist_ok=True)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    print(f"Saved {len(keep)} new channels to {filename}.")
     return filename
 
 
+def load_known_channels(max_age_days: float = 30.0, root: str = DATA_DIR) -> Dict[str, Dict]:
+    """Load the snippets of channels saved in the last ``max_age_days`` days.
+
+    Only the partitions written within the window are read, and only the
+    columns needed to rebuild a ``channels.list`` snippet.
+
+    Parameters
+    ----------
+    max_age_days : float, optional
+        How many days of history to consider.  Defaults to 30.
+    root : str, optional
+        Root directory of the Parquet dataset.  Defaults to ``DATA_DIR``.
+
+    Returns
+    -------
+    Dict[str, Dict]
+        A mapping of channel ID to a snippet with ``title`` and
+        ``publishedAt`` keys.  Empty if no dataset exists yet or the history
+        cannot be read, in which case every channel is treated as new.
+    """
+    if not os.path.isdir(root):
+        return {}
+    try:
+        dataset = ds.dataset(root, format="parquet", partitioning="hive")
+        if not dataset.files:
+            return {}
+        since = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        partition_date = ds.field("year") * 10000 + ds.field("month") * 100 + ds.field("day")
+        table = dataset.to_table(
+            columns=["channel_id", "channel_title", "published_at"],
+            filter=partition_date >= int(since.strftime("%Y%m%d")),
+        )
+    except Exception as e:
+        print(f"Could not read channel history from '{root}'; treating all channels as new: {e}")
+        return {}
+    return {
+        channel_id: {"title": title, "publishedAt": published_at}
+        for channel_id, title, published_at in zip(
+            table.column("channel_id").to_pylist(),
+            table.column("channel_title").to_pylist(),
+            table.column("published_at").to_pylist(),
+        )
+    }
+
+
 def main() -> None:
     """Main entry point for running the discovery pipeline.
 
-    Loads environment variables, initialises the API client, collects recent
-    channel data based on the configured search queries, filters the results
-    for channels created within 30 days, and writes the output to CSV.
+    Loads environment variables, collects recent channel data based on the
+    configured search queries, filters the results for channels created
+    within 30 days, and writes the output to the Parquet dataset.
     """
     # Load environment variables from .env if present.  This allows you to
     # develop locally without exposing the API key in your code.  When running
@@ -276,7 +678,6 @@ def main() -> None:
             "YOUTUBE_API_KEY environment variable not set. "
             "Define it in a .env file or set it in your execution environment."
         )
-    youtube = get_youtube_client(api_key)
     # Configure your search queries here.  Feel free to add or remove terms.
     search_queries = [
         "first vlog",
@@ -287,7 +688,11 @@ def main() -> None:
         "vlog day 1",
         "first video",
     ]
-    all_data = collect_new_channels(youtube, search_queries, window_hours=24)
+    known_channels = load_known_channels(max_age_days=30.0)
+    with ChannelCache() as cache:
+        all_data = collect_new_channels(
+            api_key, search_queries, window_hours=24, cache=cache, known_channels=known_channels
+        )
     filter_and_save_channels(all_data, max_age_days=30.0)
 
 